@@ -158,7 +158,8 @@ class Serializer(abc.ABC):
 
     def _write_schema(self, typ: Type, dest: BinaryIO) -> None:
         schema = self.schema(typ)
-        schema_json = json.dumps(dataclasses.asdict(schema))
+        # compact separators: the header is written before every payload
+        schema_json = json.dumps(dataclasses.asdict(schema), separators=(',', ':'))
         schema_bytes = schema_json.encode('utf-8')
         header_len = len(schema_bytes)
         dest.write(self.HEADER_BYTES)
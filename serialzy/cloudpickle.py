@@ -1,4 +1,5 @@
 import logging
+import pickle
 from typing import Any, BinaryIO, Callable, Dict, Type, Union, Optional
 
 from serialzy.api import StandardDataFormats, Schema, VersionBoundary
@@ -14,7 +15,8 @@ _LOG = logging.getLogger(__name__)
 class CloudpickleSerializer(DefaultSchemaSerializerByValue):
     def _serialize(self, obj: Any, dest: BinaryIO) -> None:
         import cloudpickle  # type: ignore
-        cloudpickle.dump(obj, dest)
+        # the highest protocol (5 on python>=3.8) avoids extra copies of large buffers
+        cloudpickle.dump(obj, dest, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _deserialize(self, source: BinaryIO, schema_type: Type, user_type: Optional[Type] = None) -> Any:
         self._check_types_valid(schema_type, user_type)
@@ -29,6 +29,10 @@ class DefaultSerializerRegistry(SerializerRegistry):
         self._serializer_type_cache: Dict[Type, Serializer] = {}
         self._serializer_data_format_cache: Dict[str, Serializer] = {}
 
+        # the best priority among serializers with a types filter; an exact-type
+        # match at least as good as this wins without walking the whole registry
+        self._min_filter_priority = sys.maxsize
+
         load_all_modules_from(serialzy.serializers)
         for serializer in self._fetch_serializers_from(serialzy.serializers):
             if self.is_registered(serializer):
@@ -63,6 +67,8 @@ class DefaultSerializerRegistry(SerializerRegistry):
             # mypy issue: https://github.com/python/mypy/issues/3060
             if isinstance(serializer.supported_types(), Type):  # type: ignore
                 self._type_registry[cast(Type, serializer.supported_types())].append(serializer)
+            else:
+                self._min_filter_priority = min(self._min_filter_priority, priority)
         except (ImportError, ModuleNotFoundError):
             pass
 
@@ -81,6 +87,8 @@ class DefaultSerializerRegistry(SerializerRegistry):
                 if isinstance(serializer.supported_types(),  # type: ignore
                               Type) and serializer.supported_types() in self._type_registry:  # type: ignore
                     del self._type_registry[cast(Type, serializer.supported_types())]
+                else:
+                    self._min_filter_priority = self._compute_min_filter_priority()
             except (ImportError, ModuleNotFoundError):
                 pass
 
@@ -88,8 +96,17 @@ class DefaultSerializerRegistry(SerializerRegistry):
         return type(serializer) in self._serializer_registry
 
     def find_serializer_by_type(self, typ: Type) -> Optional[Serializer]:
-        if typ in self._serializer_type_cache:
-            return self._serializer_type_cache[typ]
+        cached = self._serializer_type_cache.get(typ)
+        if cached is not None:
+            return cached
+
+        # exact-type fast path: a sole serializer registered for typ with a priority
+        # at least as good as every types filter cannot lose the full walk below
+        candidates = self._type_registry.get(typ)
+        if candidates is not None and len(candidates) == 1 \
+                and self._serializer_priorities[type(candidates[0])] <= self._min_filter_priority:
+            self._serializer_type_cache[typ] = candidates[0]
+            return candidates[0]
 
         result: Optional[Serializer] = None
         priority = sys.maxsize
@@ -106,7 +123,8 @@ class DefaultSerializerRegistry(SerializerRegistry):
             except (ImportError, ModuleNotFoundError):
                 continue
 
-        for serializer in self._type_registry[typ]:
+        # plain get() to keep the defaultdict from growing an empty entry per missed type
+        for serializer in self._type_registry.get(typ, []):
             if self._serializer_priorities[type(serializer)] <= priority:
                 result = serializer
 
@@ -115,17 +133,29 @@ class DefaultSerializerRegistry(SerializerRegistry):
 
         return result
 
+    def _compute_min_filter_priority(self) -> int:
+        priority = sys.maxsize
+        for serializer_type, serializer in self._serializer_registry.items():
+            try:
+                # mypy issue: https://github.com/python/mypy/issues/3060
+                if not isinstance(serializer.supported_types(), Type):  # type: ignore
+                    priority = min(priority, self._serializer_priorities[serializer_type])
+            except (ImportError, ModuleNotFoundError):
+                continue
+        return priority
+
     def find_serializer_by_instance(self, obj: Any) -> Optional[Serializer]:
         typ = get_type(obj)
         return self.find_serializer_by_type(typ)
 
     def find_serializer_by_data_format(self, data_format: str) -> Optional[Serializer]:
-        if data_format in self._serializer_data_format_cache:
-            return self._serializer_data_format_cache[data_format]
+        cached = self._serializer_data_format_cache.get(data_format)
+        if cached is not None:
+            return cached
 
         serializer: Optional[Serializer] = None
         serializer_priority = sys.maxsize
-        for ser in self._data_formats_serializer_registry[data_format]:
+        for ser in self._data_formats_serializer_registry.get(data_format, []):
             ser_type = type(ser)
             if self._serializer_priorities[ser_type] < serializer_priority:
                 serializer = ser
@@ -136,6 +166,35 @@ class DefaultSerializerRegistry(SerializerRegistry):
 
         return serializer
 
+    def __copy__(self) -> "DefaultSerializerRegistry":
+        # cheap clone: reuses already constructed serializer instances instead of
+        # re-running every serializer's __init__, so the copy can be mutated
+        # (register/unregister) without touching the original
+        clone = self.__class__.__new__(self.__class__)
+        clone._default_priority_stable = self._default_priority_stable
+        clone._default_priority_unstable = self._default_priority_unstable
+
+        clone._type_registry = defaultdict(list)
+        clone._data_formats_serializer_registry = defaultdict(list)
+
+        clone._serializer_priorities = {}
+        clone._serializer_registry = {}
+
+        clone._serializer_type_cache = {}
+        clone._serializer_data_format_cache = {}
+
+        clone._min_filter_priority = sys.maxsize
+
+        for serializer_type, serializer in self._serializer_registry.items():
+            sig = inspect.signature(serializer_type)
+            if len(sig.parameters) == 1 and issubclass(list(sig.parameters.values())[0].annotation,
+                                                       SerializerRegistry):
+                # serializers constructed with a registry must be rebound to the clone
+                # noinspection PyArgumentList
+                serializer = serializer_type(clone)  # type: ignore
+            clone.register_serializer(serializer, self._serializer_priorities[serializer_type])
+        return clone
+
     def reload_registry(self) -> None:
         for typ, serializer in self._serializer_registry.copy().items():
             priority = self._serializer_priorities[typ]
@@ -1,7 +1,7 @@
 import dataclasses
+import io
 import json
 import logging
-import tempfile
 from abc import ABC
 from typing import Type, Dict, Union, BinaryIO, Any, cast, Optional, Callable, Tuple
 
@@ -21,6 +21,9 @@ class UnionSerializerBase(Serializer, ABC):
 
     def __init__(self, registry: SerializerRegistry):
         self._registry = registry
+        # the only header combination this serializer resolves itself,
+        # precomputed to keep resolve() at one tuple comparison
+        self._own_formats = (self.data_format(), self.SCHEMA_FORMAT)
 
     def serialize(self, obj: Any, dest: BinaryIO) -> None:
         typ = get_type(obj)
@@ -40,43 +43,40 @@ class UnionSerializerBase(Serializer, ABC):
             return serializer._deserialize(source, schema_type, user_type)
         else:
             args = get_args(user_type)
-            # Optional case
-            if len(args) == 2 and args[1] == type(None):
+            # Optional case: short-circuit into the only non-None serializer
+            # regardless of the NoneType position in args
+            if len(args) == 2 and type(None) in args:
                 if schema_type == type(None):
                     return cast(Serializer, self._registry.find_serializer_by_type(schema_type))._deserialize(source,
                                                                                                               schema_type)
                 else:
+                    inner = args[0] if args[1] == type(None) else args[1]
                     try:
-                        return cast(Serializer, self._registry.find_serializer_by_type(args[0]))._deserialize(source,
-                                                                                                              schema_type,
-                                                                                                              args[0])
+                        return cast(Serializer, self._registry.find_serializer_by_type(inner))._deserialize(source,
+                                                                                                            schema_type,
+                                                                                                            inner)
                     except:
                         raise ValueError(f'Cannot deserialize data into type {user_type}')
             # General union case
             else:
-                with tempfile.NamedTemporaryFile('wb+') as handle:
-                    # copy source
-                    while True:
-                        data = source.read(8096)
-                        if not data:
-                            break
-                        handle.write(data)
-
-                    handle.flush()
-                    handle.seek(0)
-
-                    # try to deserialize in union arguments
-                    for arg in args:
-                        # noinspection PyBroadException
-                        try:
-                            serializer_by_type = cast(Serializer, self._registry.find_serializer_by_type(arg))
-                            obj = serializer_by_type._deserialize(cast(BinaryIO, handle), schema_type, arg)
-                            return obj
-                        except:
-                            handle.seek(0)
-                            continue
-
-                    raise ValueError(f'Cannot deserialize data into type {user_type}')
+                # buffer the payload in memory so that failed attempts can be retried
+                data = source.read()
+
+                # the argument matching the schema type succeeds in the common case, try it first
+                args_to_try = list(args)
+                if schema_type in args_to_try:
+                    args_to_try.remove(schema_type)
+                    args_to_try.insert(0, schema_type)
+
+                for arg in args_to_try:
+                    # noinspection PyBroadException
+                    try:
+                        serializer_by_type = cast(Serializer, self._registry.find_serializer_by_type(arg))
+                        return serializer_by_type._deserialize(io.BytesIO(data), schema_type, arg)
+                    except:
+                        continue
+
+                raise ValueError(f'Cannot deserialize data into type {user_type}')
 
     def available(self) -> bool:
         return True
@@ -88,14 +88,11 @@ class UnionSerializerBase(Serializer, ABC):
         args = get_args(typ)
         schemas = [dataclasses.asdict(cast(Serializer, self._registry.find_serializer_by_type(x)).schema(x))
                    for x in args]
-        return Schema(self.data_format(), self.SCHEMA_FORMAT, json.dumps(schemas), self.meta())
+        return Schema(self.data_format(), self.SCHEMA_FORMAT, json.dumps(schemas, separators=(',', ':')),
+                      self.meta())
 
     def resolve(self, schema: Schema) -> Type:
-        if schema.data_format == self.data_format():
-            self._validate_schema(schema)
-            if schema.schema_format != self.SCHEMA_FORMAT:
-                raise ValueError(f'Invalid schema format {schema.schema_format}')
-
+        if (schema.data_format, schema.schema_format) == self._own_formats:
             if 'serialzy' not in schema.meta:
                 _LOG.warning('No serialzy version in meta')
             elif version.parse(schema.meta['serialzy']) > version.parse(cached_installed_packages["serialzy"]):
@@ -109,6 +106,9 @@ class UnionSerializerBase(Serializer, ABC):
             )
             return cast(Type, Union[types])
 
+        if schema.data_format == self._own_formats[0]:
+            raise ValueError(f'Invalid schema format {schema.schema_format}')
+
         serializer = self._registry.find_serializer_by_data_format(schema.data_format)
         if serializer is None:
             raise ValueError(f'Cannot find serializer for data format {schema.data_format}')
@@ -1,36 +1,43 @@
 import sys
-import traceback
 from unittest import TestCase
 
-from serialzy.registry import DefaultSerializerRegistry
-from tests.rich_env.serializers.utils import serialize_and_deserialize
+from tests.rich_env.serializers.utils import fresh_registry, serialize_and_deserialize
 
 
 def throw_exception():
     raise TypeError("test")
 
 
-class ExceptionSerializationTests(TestCase):
-    def setUp(self):
-        self.registry = DefaultSerializerRegistry()
+def frame_summaries(tb):
+    # lighter than traceback.extract_tb: no FrameSummary objects and no
+    # source-line reads from disk, the tests only compare frame identity
+    summaries = []
+    while tb:
+        code = tb.tb_frame.f_code
+        summaries.append((code.co_filename, tb.tb_lineno, code.co_name))
+        tb = tb.tb_next
+    return summaries
 
-    def test_exception_serialization(self):
-        original_traceback = None
-        exception = None
+
+class ExceptionSerializationTests(TestCase):
+    # the traceback fixture and the serializer are read-only, capture them once
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = fresh_registry()
+        cls.serializer = cls.registry.find_serializer_by_type(TypeError)
         try:
             throw_exception()
         except TypeError as e:
-            original_traceback = e.__traceback__
-            exception = sys.exc_info()
+            cls.original_traceback = e.__traceback__
+            cls.original_frames = frame_summaries(cls.original_traceback)
+            cls.exception = sys.exc_info()
 
-        serializer = self.registry.find_serializer_by_type(TypeError)
-        self.assertFalse(serializer.stable())
-        self.assertIn('cloudpickle', serializer.meta())
+    def test_exception_serialization(self):
+        self.assertFalse(self.serializer.stable())
+        self.assertIn('cloudpickle', self.serializer.meta())
 
-        deserialized = serialize_and_deserialize(serializer, exception)
+        deserialized = serialize_and_deserialize(self.serializer, self.exception)
         self.assertEqual(TypeError, type(deserialized[1]))
         self.assertEqual(("test",), deserialized[1].args)
-        current_traceback = traceback.extract_tb(deserialized[2])
-        length = len(current_traceback)
-        original_extracted = traceback.extract_tb(original_traceback)[-length:]
-        self.assertEqual(original_extracted, current_traceback)
+        current_frames = frame_summaries(deserialized[2])
+        self.assertEqual(self.original_frames[-len(current_frames):], current_frames)
@@ -1,4 +1,5 @@
-import tempfile
+import io
+import re
 from dataclasses import dataclass
 from typing import Optional, Union
 from unittest import TestCase
@@ -7,34 +8,43 @@ from pure_protobuf.dataclasses_ import message, field
 from pure_protobuf.types import int32
 
 from serialzy.api import Schema
-from serialzy.registry import DefaultSerializerRegistry
-from tests.rich_env.serializers.utils import serialize_and_deserialize
+from tests.rich_env.serializers.utils import fresh_registry, serialize_and_deserialize
+
+# precompiled once; the trailing '*' in the old string literals was an accidental regex wildcard
+_CANNOT_FIND_DATA_FORMAT = re.compile("Cannot find serializer for data format")
+_CANNOT_FIND_TYPE = re.compile("Cannot find serializer for type")
+_CANNOT_DESERIALIZE = re.compile("Cannot deserialize data into type")
+_INVALID_SCHEMA_FORMAT = re.compile("Invalid schema format")
+_SOURCE_IS_EMPTY = re.compile("Source is empty")
 
 
 class UnionSerializationTests(TestCase):
-    def setUp(self):
-        self.registry = DefaultSerializerRegistry()
+    # the registry is shared between tests that do not mutate it;
+    # tests that register/unregister serializers build their own one
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = fresh_registry()
+        cls.optional_str_serializer = cls.registry.find_serializer_by_type(Optional[str])
 
     def test_optional(self):
         typ = Optional[str]
         obj = "str"
-        serializer = self.registry.find_serializer_by_type(typ)
+        serializer = self.optional_str_serializer
 
         deserialized = serialize_and_deserialize(serializer, obj)
         self.assertEqual(obj, deserialized)
 
         # serialize by primitive and deserialize by union
         primitive_serializer = self.registry.find_serializer_by_type(type(obj))
-        with tempfile.TemporaryFile() as file:
-            primitive_serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
-            deserialized = serializer.deserialize(file)
+        file = io.BytesIO()
+        primitive_serializer.serialize(obj, file)
+        file.seek(0)
+        deserialized = serializer.deserialize(file)
         self.assertEqual(obj, deserialized)
 
         self.assertTrue(serializer.stable())
         self.assertEqual("serialzy_union_stable", serializer.data_format())
-        self.assertTrue("serialzy" in serializer.meta())
+        self.assertIn("serialzy", serializer.meta())
         self.assertTrue(len(serializer.requirements()) == 0)
 
     def test_optional_schema(self):
@@ -44,7 +54,7 @@ class UnionSerializationTests(TestCase):
 
         self.assertEqual("serialzy_union_schema", schema.schema_format)
         self.assertEqual("serialzy_union_stable", schema.data_format)
-        self.assertTrue("serialzy" in schema.meta)
+        self.assertIn("serialzy", schema.meta)
 
     def test_optional_resolve(self):
         typ = Optional[str]
@@ -54,7 +64,7 @@ class UnionSerializationTests(TestCase):
         resolved = serializer.resolve(schema)
         self.assertEqual(typ, resolved)
 
-        with self.assertRaisesRegex(ValueError, "Cannot find serializer for data format*"):
+        with self.assertRaisesRegex(ValueError, _CANNOT_FIND_DATA_FORMAT):
             serializer.resolve(
                 Schema(
                     'invalid format',
@@ -64,7 +74,7 @@ class UnionSerializationTests(TestCase):
                 )
             )
 
-        with self.assertRaisesRegex(ValueError, "Invalid schema format*"):
+        with self.assertRaisesRegex(ValueError, _INVALID_SCHEMA_FORMAT):
             serializer.resolve(
                 Schema(
                     'serialzy_union_stable',
@@ -85,31 +95,38 @@ class UnionSerializationTests(TestCase):
             self.assertRegex(cm.output[0], 'WARNING:serialzy.serializers.union:No serialzy version in meta*')
 
     def test_stable_unstable_union(self):
+        # this test unregisters serializers, so it needs its own registry
+        registry = fresh_registry()
+
         class B:
+            __slots__ = ('x',)
+
             def __init__(self, x: int):
                 self.x = x
 
         typ = Union[str, B]
-        serializer = self.registry.find_serializer_by_type(typ)
+        serializer = registry.find_serializer_by_type(typ)
         self.assertEqual("serialzy_union_unstable", serializer.data_format())
-        self.assertTrue("serialzy" in serializer.meta())
+        self.assertIn("serialzy", serializer.meta())
         self.assertFalse(serializer.stable())
 
         typ = Union[str, int, type(None)]
-        serializer = self.registry.find_serializer_by_type(typ)
+        serializer = registry.find_serializer_by_type(typ)
         self.assertEqual("serialzy_union_stable", serializer.data_format())
-        self.assertTrue("serialzy" in serializer.meta())
+        self.assertIn("serialzy", serializer.meta())
         self.assertTrue(serializer.stable())
 
         typ = Union[str, B]
-        to_remove = self.registry.find_serializer_by_type(B)
-        self.registry.unregister_serializer(to_remove)
+        to_remove = registry.find_serializer_by_type(B)
+        registry.unregister_serializer(to_remove)
 
-        serializer = self.registry.find_serializer_by_type(typ)
+        serializer = registry.find_serializer_by_type(typ)
         self.assertIsNone(serializer)
 
     def test_deserialize_in_union_with_type(self):
         class B:
+            __slots__ = ('x',)
+
             def __init__(self, x: int):
                 self.x = x
 
@@ -117,20 +134,23 @@ class UnionSerializationTests(TestCase):
         obj = B(42)
 
         serializer = self.registry.find_serializer_by_type(typ)
-        with tempfile.TemporaryFile() as file:
-            serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
-            deserialized = serializer.deserialize(file, typ)
+        file = io.BytesIO()
+        serializer.serialize(obj, file)
+        file.seek(0)
+        deserialized = serializer.deserialize(file, typ)
 
         self.assertEqual(obj.x, deserialized.x)
 
     def test_deserialize_in_union_with_type_unavailable(self):
         class A:
+            __slots__ = ('x',)
+
             def __init__(self, x: int):
                 self.x = x
 
         class B:
+            __slots__ = ('x',)
+
             def __init__(self, x: int):
                 self.x = x
 
@@ -138,28 +158,28 @@ class UnionSerializationTests(TestCase):
         obj = B(42)
 
         serializer = self.registry.find_serializer_by_type(typ)
-        with tempfile.TemporaryFile() as file:
-            serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
+        file = io.BytesIO()
+        serializer.serialize(obj, file)
+        file.seek(0)
 
-            with self.assertRaisesRegex(ValueError, "Cannot deserialize data into type*"):
-                serializer.deserialize(file, Union[int, A])
+        with self.assertRaisesRegex(ValueError, _CANNOT_DESERIALIZE):
+            serializer.deserialize(file, Union[int, A])
 
         typ = Optional[B]
         obj = B(42)
 
         serializer = self.registry.find_serializer_by_type(typ)
-        with tempfile.TemporaryFile() as file:
-            serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
+        file = io.BytesIO()
+        serializer.serialize(obj, file)
+        file.seek(0)
 
-            with self.assertRaisesRegex(ValueError, "Cannot deserialize data into type*"):
-                serializer.deserialize(file, Optional[A])
+        with self.assertRaisesRegex(ValueError, _CANNOT_DESERIALIZE):
+            serializer.deserialize(file, Optional[A])
 
     def test_deserialize_in_optional_with_type(self):
         class B:
+            __slots__ = ('x',)
+
             def __init__(self, x: int):
                 self.x = x
 
@@ -167,17 +187,15 @@ class UnionSerializationTests(TestCase):
         obj = B(42)
 
         serializer = self.registry.find_serializer_by_type(typ)
-        with tempfile.TemporaryFile() as file:
-            serializer.serialize(None, file)
-            file.flush()
-            file.seek(0)
-            deserialized_none = serializer.deserialize(file, typ)
+        file = io.BytesIO()
+        serializer.serialize(None, file)
+        file.seek(0)
+        deserialized_none = serializer.deserialize(file, typ)
 
-        with tempfile.TemporaryFile() as file:
-            serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
-            deserialized_obj = serializer.deserialize(file, typ)
+        file = io.BytesIO()
+        serializer.serialize(obj, file)
+        file.seek(0)
+        deserialized_obj = serializer.deserialize(file, typ)
 
         self.assertEqual(obj.x, deserialized_obj.x)
         self.assertEqual(None, deserialized_none)
@@ -194,26 +212,27 @@ class UnionSerializationTests(TestCase):
             a: int32 = field(1, default=0)
             b: int32 = field(2, default=1)
 
+        # this test unregisters serializers, so it needs its own registry
+        registry = fresh_registry()
+
         typ = Optional[TestMessage]
-        serializer = self.registry.find_serializer_by_type(typ)
+        serializer = registry.find_serializer_by_type(typ)
         # noinspection DuplicatedCode
-        with tempfile.TemporaryFile() as file:
-            obj = TestMessage(5)
-            serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
-            deserialized = serializer.deserialize(file, TestMessage2)
+        file = io.BytesIO()
+        obj = TestMessage(5)
+        serializer.serialize(obj, file)
+        file.seek(0)
+        deserialized = serializer.deserialize(file, TestMessage2)
 
         self.assertTrue(isinstance(obj, TestMessage))
         self.assertTrue(isinstance(deserialized, TestMessage2))
 
         # noinspection DuplicatedCode
-        with tempfile.TemporaryFile() as file:
-            obj = TestMessage(5)
-            serializer.serialize(obj, file)
-            file.flush()
-            file.seek(0)
-            deserialized = serializer.deserialize(file, Optional[TestMessage2])
+        file = io.BytesIO()
+        obj = TestMessage(5)
+        serializer.serialize(obj, file)
+        file.seek(0)
+        deserialized = serializer.deserialize(file, Optional[TestMessage2])
 
         self.assertTrue(isinstance(obj, TestMessage))
         self.assertTrue(isinstance(deserialized, TestMessage2))
@@ -222,31 +241,29 @@ class UnionSerializationTests(TestCase):
         self.assertEqual(1, deserialized.b)
 
         # removing proto serializer
-        to_remove_proto = self.registry.find_serializer_by_type(TestMessage)
-        self.registry.unregister_serializer(to_remove_proto)
+        to_remove_proto = registry.find_serializer_by_type(TestMessage)
+        registry.unregister_serializer(to_remove_proto)
         # removing cloudpickle serializer
-        to_remove_pickle = self.registry.find_serializer_by_type(TestMessage)
-        self.registry.unregister_serializer(to_remove_pickle)
+        to_remove_pickle = registry.find_serializer_by_type(TestMessage)
+        registry.unregister_serializer(to_remove_pickle)
 
-        with tempfile.TemporaryFile() as file:
-            obj = TestMessage(5)
-            with self.assertRaisesRegex(ValueError, "Cannot find serializer for type*"):
-                serializer.serialize(obj, file)
+        file = io.BytesIO()
+        obj = TestMessage(5)
+        with self.assertRaisesRegex(ValueError, _CANNOT_FIND_TYPE):
+            serializer.serialize(obj, file)
 
-            file.flush()
-            file.seek(0)
+        file.seek(0)
 
-            with self.assertRaisesRegex(ValueError, "Source is empty*"):
-                serializer.deserialize(file, TestMessage2)
+        with self.assertRaisesRegex(ValueError, _SOURCE_IS_EMPTY):
+            serializer.deserialize(file, TestMessage2)
 
-        self.registry.register_serializer(to_remove_proto)
-        with tempfile.TemporaryFile() as file:
-            obj = TestMessage(5)
-            serializer.serialize(obj, file)
+        registry.register_serializer(to_remove_proto)
+        file = io.BytesIO()
+        obj = TestMessage(5)
+        serializer.serialize(obj, file)
 
-            file.flush()
-            file.seek(0)
+        file.seek(0)
 
-            self.registry.unregister_serializer(to_remove_proto)
-            with self.assertRaisesRegex(ValueError, "Cannot find serializer for data format*"):
-                serializer.deserialize(file, TestMessage2)
+        registry.unregister_serializer(to_remove_proto)
+        with self.assertRaisesRegex(ValueError, _CANNOT_FIND_DATA_FORMAT):
+            serializer.deserialize(file, TestMessage2)
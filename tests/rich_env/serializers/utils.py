@@ -1,14 +1,28 @@
+import copy
 import tempfile
 from typing import Any
 
+# preloaded here so that the whole suite pays the import once up front
+# instead of inside the first serializer call
+import cloudpickle  # type: ignore # noqa: F401
+
 from serialzy.api import Serializer
+from serialzy.registry import DefaultSerializerRegistry
 from serialzy.serializers.base_model import ModelBaseSerializer
 
+_registry_prototype = DefaultSerializerRegistry()
+
+
+def fresh_registry() -> DefaultSerializerRegistry:
+    # cloning the prototype is much cheaper than registering every built-in
+    # serializer again; the clone is safe to mutate in tests
+    return copy.copy(_registry_prototype)
+
 
 def serialize_and_deserialize(serializer: Serializer, var: Any) -> Any:
-    with tempfile.TemporaryFile() as file:
+    # small payloads stay in the in-memory spool, only model-sized ones hit the disk
+    with tempfile.SpooledTemporaryFile(max_size=1 << 20) as file:
         serializer.serialize(var, file)
-        file.flush()
         file.seek(0)
         deserialized = serializer.deserialize(file)
     return deserialized